@@ -3,6 +3,9 @@ Requirements:
  pip install PyQt5
  pip install pywin32
 
+Optional:
+ pip install orjson ijson
+
 Run:
  python GameNest.py
 """
@@ -10,19 +13,33 @@ Run:
 import sys
 import os
 import json
-import subprocess
+import re
+import gzip
 import ctypes
+import collections
+import concurrent.futures
 from pathlib import Path
 from PyQt5 import QtWidgets, QtGui, QtCore
 import win32api, win32con, win32gui, win32ui
 from PyQt5.QtWidgets import QGraphicsDropShadowEffect
 from PyQt5.QtGui import QColor
-import subprocess
 import time
 from PyQt5.QtMultimedia import QSoundEffect
 from PyQt5.QtCore import QUrl
 
-GAMES_DB = Path(__file__).with_suffix("").parent / "games.json"
+try:
+    import orjson  # optional, faster serialization for large libraries
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # optional, incremental parsing of games.json
+except ImportError:
+    ijson = None
+
+ICON_SIZE = 48                               # sidebar icon edge, also the atlas row height
+ATLAS_INDEX_ROLE = QtCore.Qt.UserRole + 1    # sidebar item -> its slot in the icon atlas
+ATLAS_PAGE_ROWS = 256                        # icons per atlas page; keeps each page far below the 32767 px pixmap limit
 
 # -------------------- Admin Check --------------------
 def is_admin():
@@ -32,80 +49,42 @@ def is_admin():
     except:
         return False
 
-def run_as_admin():
-    """Relaunch the script with admin privileges via UAC prompt."""
+def run_as_admin(extra_args=()):
+    """Relaunch the script with admin privileges via UAC prompt, appending extra_args to its argv.
+    Quits this instance once the elevated one has started; returns False if the prompt was declined or failed."""
     python_exe = sys.executable
     script = os.path.abspath(sys.argv[0])
-    params = ' '.join([f'"{x}"' for x in sys.argv[1:]])
+    args = sys.argv[1:] + [a for a in extra_args if a not in sys.argv]
+    params = ' '.join([f'"{x}"' for x in args])
     # ShellExecuteW returns >32 if successful
-    ctypes.windll.shell32.ShellExecuteW(None, "runas", python_exe, f'"{script}" {params}', None, 1)
-    sys.exit()  # exit current instance immediately
-
-# -------------------- Main --------------------
-if __name__ == "__main__":
-    # Trigger UAC immediately if not admin
-    if not is_admin():
-        run_as_admin()
+    if ctypes.windll.shell32.ShellExecuteW(None, "runas", python_exe, f'"{script}" {params}', None, 1) <= 32:
+        return False
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        sys.exit()  # exit current instance immediately
+    app.quit()  # leave the event loop; aboutToQuit flushes any pending save
+    return True
 
-    # From here on, we are running as admin
-    from GameNest import GameNestLauncher  # import after admin check to avoid PyQt init issues
 
-    app = QtWidgets.QApplication(sys.argv)
-    win = GameNestLauncher()
-    win.show()
-    sys.exit(app.exec_())
-    
 class HoverButton(QtWidgets.QPushButton):
-    def __init__(self, text, sound_effect=None):
-        super().__init__(text)
-        self.sound_effect = sound_effect
-
-    def enterEvent(self, event):
-        if self.sound_effect:
-            self.sound_effect.play()
-        super().enterEvent(event)    
-
-def launch_selected_game(self):
-    item = self.sidebar.currentItem()
-    if not item:
-        QtWidgets.QMessageBox.information(self, "Launch", "Please select a game first.")
-        return
+    sound_effect = None  # one QSoundEffect shared by every HoverButton, see set_hover_sound()
 
-    game = next((g for g in self.games if g.path == item.data(QtCore.Qt.UserRole)), None)
-    if not game:
-        return
-
-    try:
-        # Start the game process
-        process = subprocess.Popen([game.path])
-        start_time = time.time()
+    @classmethod
+    def set_hover_sound(cls, url, volume=1.0):
+        """Load the hover sample once for all buttons, e.g. set_hover_sound(QUrl.fromLocalFile('hover.wav'))."""
+        effect = QSoundEffect()
+        effect.setSource(url)
+        effect.setVolume(volume)
+        effect.setLoopCount(1)
+        cls.sound_effect = effect
 
-        # Optional: disable launcher while game is running
-        self.setEnabled(False)
-
-        # Wait until the game process exits
-        process.wait()
-        end_time = time.time()
-
-        # Re-enable launcher
-        self.setEnabled(True)
-
-        # Update playtime
-        session_seconds = int(end_time - start_time)
-        game.total_playtime += session_seconds
-        game.last_played = QtCore.QDateTime.currentDateTime().toString("yyyy-MM-dd hh:mm:ss")
-        
-        self.save_games()
-        self.on_game_selected(item)
-
-        # Show a small notification
-        QtWidgets.QMessageBox.information(self, "Playtime Recorded",
-                                          f"You played {game.name} for {session_seconds//3600}h "
-                                          f"{(session_seconds%3600)//60}m {session_seconds%60}s this session.")
-
-    except Exception as e:
-        self.setEnabled(True)
-        QtWidgets.QMessageBox.warning(self, "Error", f"Failed to launch: {e}")
+    def enterEvent(self, event):
+        effect = type(self).sound_effect
+        if effect:
+            # Restart instead of overlapping when hovers come in bursts
+            effect.stop()
+            effect.play()
+        super().enterEvent(event)
 
 def get_game_icon(exe_path):
     """
@@ -117,21 +96,36 @@ def get_game_icon(exe_path):
     icon_save_path = Path(folder) / (os.path.splitext(os.path.basename(exe_path))[0] + ".bmp")
 
     # --- Try extracting from exe ---
+    # Runs on worker threads, several at once: every GDI handle taken here is
+    # created, used and released on the calling thread, so nothing accumulates.
+    large = small = ()
+    screen_dc = hdc_mem = hbmp = old_bmp = None
     try:
         large, small = win32gui.ExtractIconEx(exe_path, 0)
         if large:
             ico_x = win32api.GetSystemMetrics(win32con.SM_CXICON)
-            hdc = win32ui.CreateDCFromHandle(win32gui.GetDC(0))
+            screen_dc = win32gui.GetDC(0)
+            hdc = win32ui.CreateDCFromHandle(screen_dc)
             hbmp = win32ui.CreateBitmap()
             hbmp.CreateCompatibleBitmap(hdc, ico_x, ico_x)
             hdc_mem = hdc.CreateCompatibleDC()
-            hdc_mem.SelectObject(hbmp)
+            old_bmp = hdc_mem.SelectObject(hbmp)
             win32gui.DrawIconEx(hdc_mem.GetHandleOutput(), 0, 0, large[0], ico_x, ico_x, 0, 0, win32con.DI_NORMAL)
             hbmp.SaveBitmapFile(hdc_mem, str(icon_save_path))
-            for i in large: win32gui.DestroyIcon(i)
             return str(icon_save_path)
     except Exception as e:
         print(f"Failed to extract icon from exe: {e}")
+    finally:
+        if hdc_mem is not None:
+            if old_bmp is not None:
+                hdc_mem.SelectObject(old_bmp)  # a bitmap can't be deleted while selected
+            hdc_mem.DeleteDC()
+        if hbmp is not None and hbmp.GetHandle():
+            win32gui.DeleteObject(hbmp.GetHandle())
+        if screen_dc is not None:
+            win32gui.ReleaseDC(0, screen_dc)
+        for i in (*large, *small):
+            win32gui.DestroyIcon(i)
 
     # --- Fallback: search for .ico files in the folder ---
     try:
@@ -143,17 +137,457 @@ def get_game_icon(exe_path):
 
     return None
 
+def path_key(path):
+    """Normalize a path for dict lookups so case and separator differences on Windows still match."""
+    return os.path.normcase(os.path.normpath(path))
+
+def format_playtime(seconds):
+    return f"{seconds//3600}h {(seconds%3600)//60}m {seconds%60}s"
+
+def dump_json(obj):
+    """Serialize to compact UTF-8 JSON bytes, with orjson when it's installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+def load_json(raw):
+    """Parse JSON from bytes or str, with orjson when it's installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+# Substrings of helper executables that are never the game itself, matched in one C-level search
+BAD_EXE_PARTS = ('unitycrashhandler', '_data', '_x64')
+BAD_EXE_RE = re.compile("|".join(map(re.escape, BAD_EXE_PARTS)))
+
+# Bounds on the per-folder search; the game exe is almost always near the top of the install
+FIND_EXE_MAX_DEPTH = 4
+FIND_EXE_MAX_CANDIDATES = 256
+# Asset/redistributable subtrees that never hold the game exe ("parent/child" entries match nested dirs)
+FIND_EXE_SKIP_DIRS = frozenset((
+    'plugins', 'mods', 'localization', 'content', 'assets', 'redist',
+    'crashreporter', '_commonredist', 'engine', 'binaries/thirdparty',
+))
+
+def _keep_dir(parent_name, name, depth):
+    return (depth < FIND_EXE_MAX_DEPTH and name not in FIND_EXE_SKIP_DIRS
+            and f"{parent_name}/{name}" not in FIND_EXE_SKIP_DIRS)
+
+def _iter_exes_scandir(folder_path):
+    queue = collections.deque([(folder_path, 0, "")])
+    while queue:
+        dir_path, depth, dir_name = queue.popleft()
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        name = entry.name.lower()
+                        if _keep_dir(dir_name, name, depth):
+                            queue.append((entry.path, depth + 1, name))
+                    # Most entries are asset files: reject them on the suffix alone before any scoring
+                    elif entry.name[-4:].lower() == ".exe":
+                        yield entry.name.lower(), entry.path
+        except OSError:
+            continue
+
+def _iter_exes_walk(folder_path):
+    # fwalk keeps a dir fd open and stats entries relative to it, so paths aren't re-resolved per entry
+    walk = os.fwalk if hasattr(os, "fwalk") else os.walk
+    base_depth = folder_path.rstrip(os.sep).count(os.sep)
+    for dir_path, dirnames, filenames, *_ in walk(folder_path):
+        depth = dir_path.rstrip(os.sep).count(os.sep) - base_depth
+        dir_name = os.path.basename(dir_path).lower() if depth else ""
+        dirnames[:] = [d for d in dirnames if _keep_dir(dir_name, d.lower(), depth)]
+        for f in filenames:
+            if f[-4:].lower() == ".exe":
+                yield f.lower(), os.path.join(dir_path, f)
+
+def _iter_exes(folder_path):
+    """Yield (lowercased name, path) for every .exe under folder_path.
+
+    Noise subtrees are pruned and the walk stops FIND_EXE_MAX_DEPTH levels
+    down. Windows uses a breadth-first os.scandir walk; elsewhere os.fwalk
+    (or os.walk on builds without it) is used top-down.
+    """
+    if sys.platform == "win32":
+        return _iter_exes_scandir(folder_path)
+    return _iter_exes_walk(folder_path)
+
+def find_game_exe(folder_path):
+    """Pick the most likely game executable inside a game folder, or None.
+
+    Preference: an exe named after the folder, then a launcher, then any exe
+    that isn't a known helper, then any exe at all. Walks the tree once via
+    _iter_exes and stops at the first folder-name match, or after
+    FIND_EXE_MAX_CANDIDATES exes.
+    """
+    folder_basename = os.path.basename(folder_path).lower()
+    launcher = filtered = first = None
+    seen = 0
+    for name, path in _iter_exes(folder_path):
+        bad = BAD_EXE_RE.search(name) is not None
+        if not bad and folder_basename in name[:-4]:
+            return path
+        if first is None:
+            first = path
+        if not bad:
+            if launcher is None and 'launcher' in name:
+                launcher = path
+            if filtered is None:
+                filtered = path
+        seen += 1
+        if seen >= FIND_EXE_MAX_CANDIDATES:
+            break
+    return launcher or filtered or first
+
+class IconExtractSignals(QtCore.QObject):
+    done = QtCore.pyqtSignal(str, object)  # exe_path, icon path or None
+
+class IconExtractJob(QtCore.QRunnable):
+    """Run get_game_icon on a QThreadPool worker and report the result via signals.done."""
+    def __init__(self, exe_path):
+        super().__init__()
+        self.exe_path = exe_path
+        self.signals = IconExtractSignals()
+
+    def run(self):
+        self.signals.done.emit(self.exe_path, get_game_icon(self.exe_path))
+
+def render_shadow_pixmap(color=QtGui.QColor(125,0,230), blur=25, radius=0):
+    """Prerender a soft glow as a 9-slice source (border blur + radius): `blur`-px
+    falloff around a solid core with `radius`-px rounded corners."""
+    size = 2 * (blur + radius) + 2
+    pix = QtGui.QPixmap(size, size)
+    pix.fill(QtCore.Qt.transparent)
+    painter = QtGui.QPainter(pix)
+    painter.setRenderHint(QtGui.QPainter.Antialiasing)
+    painter.setCompositionMode(QtGui.QPainter.CompositionMode_Source)
+    painter.setPen(QtCore.Qt.NoPen)
+    core = QtCore.QRectF(blur, blur, 2 * radius + 2, 2 * radius + 2)
+    # Outermost ring first; each smaller, stronger ring replaces the one under it
+    for d in range(blur, -1, -1):
+        c = QtGui.QColor(color)
+        c.setAlpha(int(color.alpha() * (1 - d / blur) ** 2))
+        painter.setBrush(c)
+        painter.drawRoundedRect(core.adjusted(-d, -d, d, d), radius + d + 1, radius + d + 1)
+    painter.end()
+    return pix
+
+def draw_nine_slice(painter, target, pixmap, border, center=True):
+    """Paint `pixmap` over `target`, keeping `border`-px corners unscaled and stretching edges (and center)."""
+    tx = (target.left(), target.left() + border, target.right() + 1 - border, target.right() + 1)
+    ty = (target.top(), target.top() + border, target.bottom() + 1 - border, target.bottom() + 1)
+    sx = (0, border, pixmap.width() - border, pixmap.width())
+    sy = (0, border, pixmap.height() - border, pixmap.height())
+    for r in range(3):
+        for c in range(3):
+            if r == c == 1 and not center:
+                continue
+            t = QtCore.QRect(tx[c], ty[r], tx[c+1] - tx[c], ty[r+1] - ty[r])
+            if t.width() > 0 and t.height() > 0:
+                painter.drawPixmap(t, pixmap, QtCore.QRect(sx[c], sy[r], sx[c+1] - sx[c], sy[r+1] - sy[r]))
+
+class ShadowBackdrop(QtWidgets.QWidget):
+    """Central widget that paints a prerendered glow behind registered panels.
+    Replaces per-panel QGraphicsDropShadowEffect, which re-blurred each panel on every repaint."""
+    SHADOW_BLUR = 25
+
+    def __init__(self):
+        super().__init__()
+        self._panels = []   # (widget, stylesheet margin around its painted box, its border-radius)
+        self._shadows = {}  # border-radius -> prerendered glow
+
+    def add_shadow(self, widget, margin=0, radius=0):
+        self._panels.append((widget, margin, radius))
+
+    def paintEvent(self, event):
+        b = self.SHADOW_BLUR
+        painter = QtGui.QPainter(self)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        for widget, margin, radius in self._panels:
+            if not widget.isVisible():
+                continue
+            shadow = self._shadows.get(radius)
+            if shadow is None:
+                shadow = self._shadows[radius] = render_shadow_pixmap(blur=b, radius=radius)
+            box = widget.geometry().adjusted(margin, margin, -margin, -margin)
+            outer = box.adjusted(-b, -b, b, b)
+            # Only the glow outside the panel's rounded box: the panels are translucent,
+            # so the solid core would show through them and past their corners
+            clip = QtGui.QPainterPath()
+            clip.addRect(QtCore.QRectF(outer))
+            hole = QtGui.QPainterPath()
+            hole.addRoundedRect(QtCore.QRectF(box), radius, radius)
+            painter.save()
+            painter.setClipPath(clip.subtracted(hole))
+            draw_nine_slice(painter, outer, shadow, b + radius, center=False)
+            painter.restore()
+        painter.end()
+
+class IconAtlasDelegate(QtWidgets.QStyledItemDelegate):
+    """Draw sidebar icons as sub-rects of shared atlas pages instead of a QIcon per item."""
+    def __init__(self, launcher):
+        super().__init__(launcher.sidebar)
+        self.launcher = launcher
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        # Reserve the decoration area; the icon itself is blitted from the atlas in paint()
+        option.features |= QtWidgets.QStyleOptionViewItem.HasDecoration
+        option.decorationSize = QtCore.QSize(ICON_SIZE, ICON_SIZE)
+        option.icon = QtGui.QIcon()
+
+    def paint(self, painter, option, index):
+        opt = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        widget = opt.widget
+        style = widget.style() if widget else QtWidgets.QApplication.style()
+        style.drawControl(QtWidgets.QStyle.CE_ItemViewItem, opt, painter, widget)
+        atlas_index = index.data(ATLAS_INDEX_ROLE)
+        if atlas_index is None:
+            return
+        target = style.subElementRect(QtWidgets.QStyle.SE_ItemViewItemDecoration, opt, widget)
+        page, source = self.launcher._atlas_source(atlas_index)
+        painter.drawPixmap(target, page, source)
+
+class DetectSignals(QtCore.QObject):
+    progress = QtCore.pyqtSignal(int, str)  # game folders searched so far, name of the last one
+    found = QtCore.pyqtSignal(list)         # batch of (folder name, exe path, icon path)
+    finished = QtCore.pyqtSignal(dict)      # icon cache updates: path_key(exe) -> entry
+
+class DetectGamesJob(QtCore.QRunnable):
+    """Find game executables under the given roots on a QThreadPool worker.
+
+    Every game folder (first-level subdirectory of a root) is searched on its
+    own thread; scandir releases the GIL, so the walks overlap on disk. Exes
+    already in the library (known_keys) are dropped, and icons for the rest
+    come from icon_db when the exe is unchanged, otherwise are extracted in
+    parallel. Results stream out in batches of BATCH_SIZE via signals.found;
+    new cache entries are reported with signals.finished rather than written here.
+    cancel() stops the scan early; finished still fires with what was cached.
+    """
+    BATCH_SIZE = 32
+
+    def __init__(self, roots, known_keys, icon_db):
+        super().__init__()
+        self.roots = roots
+        self.known_keys = known_keys
+        self.icon_db = icon_db
+        self.signals = DetectSignals()
+        self._batch = []
+        self._cancelled = False
+
+    def cancel(self):
+        """Ask the running scan to stop; may be called from the UI thread."""
+        self._cancelled = True
+
+    @staticmethod
+    def _cancel_pending(futures):
+        for future in futures:
+            future.cancel()
+
+    def _add(self, name, exe, icon_path):
+        self._batch.append((name, exe, icon_path))
+        if len(self._batch) >= self.BATCH_SIZE:
+            self._flush()
+
+    def _flush(self):
+        if self._batch:
+            self.signals.found.emit(self._batch)
+            self._batch = []
+
+    @staticmethod
+    def _list_root(root):
+        try:
+            with os.scandir(root) as it:
+                return [(entry.name, entry.path) for entry in it if entry.is_dir()]
+        except FileNotFoundError:
+            return []  # most default library folders don't exist on a given machine
+        except OSError as e:
+            print(f"Failed to scan {root}: {e}")
+            return []
+
+    def run(self):
+        updates = {}
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as find_pool, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=8) as icon_pool:
+            # Roots are listed concurrently and each one's game folders are searched as soon as
+            # its listing arrives, so one slow network mount doesn't hold up the local ones.
+            # pending maps a future to its game folder name, or to None for a root listing.
+            pending = {find_pool.submit(self._list_root, root): None for root in self.roots}
+            icon_futures = {}
+            done = 0
+            while pending:
+                if self._cancelled:
+                    self._cancel_pending(pending)
+                    self._cancel_pending(icon_futures)
+                    break
+                completed, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in completed:
+                    name = pending.pop(future)
+                    if name is None:
+                        for folder_name, path in future.result():
+                            pending[find_pool.submit(find_game_exe, path)] = folder_name
+                        continue
+                    try:
+                        exe = future.result()
+                    except Exception as e:
+                        print(f"Failed to search {name}: {e}")
+                        exe = None
+                    done += 1
+                    self.signals.progress.emit(done, name)
+                    if not exe or path_key(exe) in self.known_keys:
+                        continue
+                    try:
+                        st = os.stat(exe)
+                    except OSError:
+                        st = None
+                    hit = self.icon_db.get(path_key(exe))
+                    if (st is not None and hit and hit["mtime"] == st.st_mtime_ns and hit["size"] == st.st_size
+                            and (hit["icon"] is None or os.path.exists(hit["icon"]))):
+                        self._add(name, exe, hit["icon"])
+                    else:
+                        # The Win32 icon calls release the GIL, so extraction overlaps across threads
+                        icon_futures[icon_pool.submit(get_game_icon, exe)] = (name, exe, st)
+
+            for future in concurrent.futures.as_completed(icon_futures):
+                if self._cancelled:
+                    self._cancel_pending(icon_futures)
+                    break
+                name, exe, st = icon_futures[future]
+                try:
+                    icon_path = future.result()
+                except Exception as e:
+                    print(f"Failed to extract icon for {exe}: {e}")
+                    icon_path = None
+                if st is not None:
+                    updates[path_key(exe)] = {"mtime": st.st_mtime_ns, "size": st.st_size, "icon": icon_path}
+                self._add(name, exe, icon_path)
+
+        self._flush()
+        self.signals.finished.emit(updates)
+
+class DetectedGamesModel(QtCore.QAbstractListModel):
+    """Rows of the detect dialog; appended in batches while the scan is still running.
+
+    icon_for maps a GameEntry to its QIcon; the launcher passes its own cached
+    lookup so a game's icon is decoded once for both the dialog and the sidebar.
+    """
+    def __init__(self, icon_for, parent=None):
+        super().__init__(parent)
+        self.entries = []
+        self._icon_for = icon_for
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.entries)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        c = self.entries[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            return f"{c.name} — {c.path}"
+        if role == QtCore.Qt.DecorationRole:
+            return self._icon_for(c)
+        return None
+
+    def append_entries(self, entries):
+        if not entries:
+            return
+        first = len(self.entries)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(entries) - 1)
+        self.entries.extend(entries)
+        self.endInsertRows()
+
+class DetectDialog(QtWidgets.QDialog):
+    """Lists detected games as they stream in; OK becomes available once the scan is done."""
+    def __init__(self, icon_for, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Detected games")
+        self.resize(600, 400)
+        layout = QtWidgets.QVBoxLayout()
+        self.status = QtWidgets.QLabel("Scanning for games...")
+        layout.addWidget(self.status)
+        self.progress = QtWidgets.QProgressBar()
+        self.progress.setRange(0, 0)  # indeterminate
+        layout.addWidget(self.progress)
+        self.model = DetectedGamesModel(icon_for, self)
+        # A view over the model renders only the visible rows; no per-row item objects
+        self.view = QtWidgets.QListView()
+        self.view.setModel(self.model)
+        self.view.setUniformItemSizes(True)
+        self.view.setIconSize(QtCore.QSize(24, 24))
+        self.view.setSelectionMode(QtWidgets.QAbstractItemView.MultiSelection)
+        layout.addWidget(self.view)
+        btns = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Ok | QtWidgets.QDialogButtonBox.Cancel)
+        btns.accepted.connect(self.accept)
+        btns.rejected.connect(self.reject)
+        self.ok_button = btns.button(QtWidgets.QDialogButtonBox.Ok)
+        self.ok_button.setEnabled(False)
+        layout.addWidget(btns)
+        self.setLayout(layout)
+
+    def set_progress(self, done, folder_name):
+        self.status.setText(f"Scanning for games... ({done} folders searched, {self.model.rowCount()} found)\n{folder_name}")
+
+    def scan_finished(self):
+        self.progress.hide()
+        self.status.setText(f"Detected {self.model.rowCount()} games. Choose which to add:")
+        self.ok_button.setEnabled(True)
+
+    def selected_entries(self):
+        return [self.model.entries[i.row()] for i in self.view.selectionModel().selectedRows()]
+
 class GameEntry:
+    __slots__ = ("name", "path", "icon_path", "is_favorite", "notes", "last_played", "total_playtime",
+                 "_name_lower", "_playtime_str", "_icon_ok", "_state")
+
     def __init__(self, name, path, icon_path=None):
         self.name = name
         self.path = path
-        self.icon_path = icon_path
+        self.set_icon_path(icon_path)
         self.is_favorite = False
         self.notes = ""
         self.last_played = "Never"
         self.total_playtime = 0
+        # Display caches, kept in sync by rename() / add_playtime()
+        self._name_lower = name.lower()
+        self._playtime_str = format_playtime(0)
+
+    # Mutate through these setters: each drops the cached to_dict() form
+    def set_icon_path(self, icon_path):
+        self.icon_path = icon_path
+        # Checked once here so render paths never stat the file
+        self._icon_ok = bool(icon_path) and os.path.exists(icon_path)
+        self._state = None
+
+    def rename(self, name):
+        self.name = name
+        self._name_lower = name.lower()
+        self._state = None
+
+    def set_favorite(self, value):
+        self.is_favorite = value
+        self._state = None
+
+    def set_notes(self, text):
+        self.notes = text
+        self._state = None
+
+    def add_playtime(self, seconds, played_at):
+        self.total_playtime += seconds
+        self.last_played = played_at
+        self._playtime_str = format_playtime(self.total_playtime)
+        self._state = None
 
     def to_dict(self):
+        """Serializable form; built once and reused by every save until the entry changes."""
+        if self._state is None:
+            self._state = self._build_state()
+        return self._state
+
+    def _build_state(self):
         return {
             "name": self.name,
             "path": self.path,
@@ -171,6 +605,7 @@ class GameEntry:
         g.notes = data.get("notes", "")
         g.last_played = data.get("last_played", "Never")
         g.total_playtime = data.get("total_playtime", 0)
+        g._playtime_str = format_playtime(g.total_playtime)
         return g
 
 class GameNestLauncher(QtWidgets.QMainWindow):
@@ -181,28 +616,75 @@ class GameNestLauncher(QtWidgets.QMainWindow):
         super().__init__()
         self.setWindowTitle("GameNest")
         self.resize(1000, 560)
-        
-        import sys, os, shutil
 
-        # --- AppData-backed games.json ---
+        # --- AppData-backed library (games.json.gz) ---
         appdata = os.getenv("APPDATA") or os.path.expanduser("~")
         appdata_dir = os.path.join(appdata, "GameNest")
         os.makedirs(appdata_dir, exist_ok=True)
         self.games_file = os.path.join(appdata_dir, "games.json")
+        self.games_gz_file = self.games_file + ".gz"  # preferred; plain games.json is read as a fallback
+        # Extracted-icon results from detection, keyed by path_key(exe) and validated by mtime + size
+        self.icon_db_file = os.path.join(appdata_dir, "_icon_cache.json")
+        self._icon_db = None
+        self._icon_db_dirty = False
 
         # --- Data ---
-        self.custom_scan_folders = []
+        self.custom_scan_folders = {}  # path_key(folder) -> folder, in insertion order
         self.games = []
+        self._by_path = {}  # path_key(path) -> GameEntry; self.games keeps display order
         self.custom_background_path = None
 
+        # --- Debounced persistence: save_games() coalesces into one write ---
+        self._save_timer = QtCore.QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._save_games_now)
+        self._save_pending = False
+        QtWidgets.QApplication.instance().aboutToQuit.connect(self._save_games_now)
+
+        # --- Game detection running on the thread pool ---
+        self._detect_job = None
+        self._detect_dialog = None
+        self._is_admin = bool(is_admin())  # can't change while the process runs
+
+        # --- Running game ---
+        self._proc = None         # QWinEventNotifier on the running game's process handle
+        self._proc_handle = None
+        self._proc_game = None
+        self._start_time = 0.0
+
+        # --- Decoded icons, keyed by icon_path; shared by the sidebar and the detect dialog ---
+        self._icon_cache = {}
+        self._fallback_icon = self.style().standardIcon(QtWidgets.QStyle.SP_ComputerIcon)
+
+        # --- Background icon extraction ---
+        self._icon_jobs = {}         # exe path -> IconExtractJob still running
+        self._icon_requested = set()  # exe paths already tried this session
+
+        # --- Sidebar items, kept across refreshes so updates are diffed ---
+        self._sidebar_items = {}  # path_key(path) -> QListWidgetItem
+        # --- Sidebar icon atlas: pages of ATLAS_PAGE_ROWS icons, one slot per game ---
+        self._atlas_pages = []
+        self._atlas_slots = {}  # path_key(game path) -> slot (page * ATLAS_PAGE_ROWS + row)
+        self._atlas_free = []   # slots of removed games, reused before new ones
+
         # --- Background ---
         self.bg_label = QtWidgets.QLabel(self)
         self.bg_label.setGeometry(0, 0, self.width(), self.height())
         self.bg_label.lower()
-        self.bg_label.setScaledContents(True)
+        # Custom backgrounds are scaled by hand in _rescale_background, centered and cropped
+        self.bg_label.setScaledContents(False)
+        self.bg_label.setAlignment(QtCore.Qt.AlignCenter)
+        self._bg_raw = None         # unscaled custom background image
+        self._bg_movie = None       # custom GIF background
+        self._bg_scaled_key = None  # (width, height, transform) of the pixmap on bg_label
+        self._bg_resize_timer = QtCore.QTimer(self)
+        self._bg_resize_timer.setSingleShot(True)
+        self._bg_resize_timer.setInterval(150)
+        self._bg_resize_timer.timeout.connect(self._rescale_background)
 
         # --- Main Layout ---
-        main_widget = QtWidgets.QWidget()
+        main_widget = ShadowBackdrop()
         self.main_layout = QtWidgets.QHBoxLayout()
         main_widget.setLayout(self.main_layout)
         self.setCentralWidget(main_widget)
@@ -316,19 +798,25 @@ class GameNestLauncher(QtWidgets.QMainWindow):
 
         # --- Sidebar ---
         self.sidebar = QtWidgets.QListWidget()
-        self.sidebar.setIconSize(QtCore.QSize(48, 48))
+        self.sidebar.setIconSize(QtCore.QSize(ICON_SIZE, ICON_SIZE))
+        self.sidebar.setItemDelegate(IconAtlasDelegate(self))
         self.sidebar.setFixedWidth(260)
         self.sidebar.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.sidebar.customContextMenuRequested.connect(self.sidebar_context_menu)
         self.sidebar.itemClicked.connect(self.on_game_selected)
 
+        # Optional hover sound: drop a hover.wav next to GameNest.py; it is decoded once for every button
+        hover_wav = os.path.join(os.path.dirname(os.path.abspath(__file__)), "hover.wav")
+        if os.path.exists(hover_wav):
+            HoverButton.set_hover_sound(QUrl.fromLocalFile(hover_wav))
+
         sidebar_layout = QtWidgets.QVBoxLayout()
         header_layout = QtWidgets.QHBoxLayout()
         title_label = QtWidgets.QLabel("GameNest")
         title_label.setStyleSheet("font-weight:bold;font-size:16pt;")
         header_layout.addWidget(title_label)
         header_layout.addStretch()
-        add_btn = QtWidgets.QPushButton("+")
+        add_btn = HoverButton("+")
         add_btn.setFixedSize(28, 28)
         add_btn.clicked.connect(self.on_add_clicked)
         header_layout.addWidget(add_btn)
@@ -337,7 +825,12 @@ class GameNestLauncher(QtWidgets.QMainWindow):
         # --- Search bar ---
         self.search_bar = QtWidgets.QLineEdit()
         self.search_bar.setPlaceholderText("Search games...")
-        self.search_bar.textChanged.connect(self.filter_sidebar)
+        # Coalesce rapid typing into a single filter pass
+        self._filter_timer = QtCore.QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(120)
+        self._filter_timer.timeout.connect(self.filter_sidebar)
+        self.search_bar.textChanged.connect(self._filter_timer.start)
         sidebar_layout.addWidget(self.search_bar)
 
         sidebar_layout.addWidget(self.sidebar)
@@ -345,7 +838,7 @@ class GameNestLauncher(QtWidgets.QMainWindow):
         sidebar_widget = QtWidgets.QWidget()
         sidebar_widget.setLayout(sidebar_layout)
         sidebar_widget.setObjectName("sidebarWidget")
-        self.apply_shadow(sidebar_widget)
+        main_widget.add_shadow(sidebar_widget, margin=8, radius=14)
 
         # --- Center Panel ---
         self.center = QtWidgets.QWidget()
@@ -353,7 +846,7 @@ class GameNestLauncher(QtWidgets.QMainWindow):
         center_layout = QtWidgets.QVBoxLayout()
         self.center.setLayout(center_layout)
 
-        self.favorite_btn = QtWidgets.QPushButton("♡ Add to Favorites")
+        self.favorite_btn = HoverButton("♡ Add to Favorites")
         self.favorite_btn.setCheckable(True)
         self.favorite_btn.clicked.connect(self.toggle_favorite)
         center_layout.addWidget(self.favorite_btn, alignment=QtCore.Qt.AlignCenter)
@@ -381,12 +874,12 @@ class GameNestLauncher(QtWidgets.QMainWindow):
         self.game_playtime = QtWidgets.QLabel("Total Playtime: 0h 0m 0s")
         center_layout.addWidget(self.game_playtime, alignment=QtCore.Qt.AlignCenter)
 
-        launch_btn = QtWidgets.QPushButton("Launch")
-        launch_btn.setFixedHeight(40)
-        launch_btn.clicked.connect(self.launch_selected_game)
-        center_layout.addWidget(launch_btn, alignment=QtCore.Qt.AlignCenter)
+        self.launch_btn = HoverButton("Launch")
+        self.launch_btn.setFixedHeight(40)
+        self.launch_btn.clicked.connect(self.launch_selected_game)
+        center_layout.addWidget(self.launch_btn, alignment=QtCore.Qt.AlignCenter)
 
-        self.apply_shadow(self.center)
+        main_widget.add_shadow(self.center, margin=10, radius=18)
 
         # --- Right Panel / Settings ---
         self.right_widget = QtWidgets.QWidget()
@@ -403,10 +896,10 @@ class GameNestLauncher(QtWidgets.QMainWindow):
         folders_tab.setLayout(folders_layout)
         self.folders_list = QtWidgets.QListWidget()
         folders_layout.addWidget(self.folders_list)
-        add_folder_btn = QtWidgets.QPushButton("Add Folder")
+        add_folder_btn = HoverButton("Add Folder")
         add_folder_btn.clicked.connect(self.add_scan_folder)
         folders_layout.addWidget(add_folder_btn)
-        remove_folder_btn = QtWidgets.QPushButton("Remove Selected Folder")
+        remove_folder_btn = HoverButton("Remove Selected Folder")
         remove_folder_btn.clicked.connect(self.remove_scan_folder)
         folders_layout.addWidget(remove_folder_btn)
         self.settings_tabs.addTab(folders_tab, "Scan Folders")
@@ -417,12 +910,12 @@ class GameNestLauncher(QtWidgets.QMainWindow):
         misc_tab.setLayout(misc_layout)
 
         # Reset Games List button
-        reset_btn = QtWidgets.QPushButton("Reset Games List")
+        reset_btn = HoverButton("Reset Games List")
         reset_btn.clicked.connect(self.reset_games_list)
         misc_layout.addWidget(reset_btn)
 
         # Set Custom Background button
-        bg_btn = QtWidgets.QPushButton("Set Custom Background")
+        bg_btn = HoverButton("Set Custom Background")
         bg_btn.clicked.connect(self.set_custom_background)
         misc_layout.addWidget(bg_btn)
 
@@ -452,46 +945,49 @@ class GameNestLauncher(QtWidgets.QMainWindow):
         self.main_layout.addWidget(self.center, stretch=1)
         self.main_layout.addWidget(self.right_widget)
 
+        # Animated default gradient; started/stopped by _update_bg_timer
+        self.bg_timer = QtCore.QTimer(self)
+        self.bg_timer.setInterval(100)
+        self.bg_timer.timeout.connect(self.update_default_background)
+
         # Load games
         self.load_games()
         self.refresh_sidebar()
         self.refresh_folders_list()
         if self.custom_background_path:
             self.load_background(self.custom_background_path)
-
-        # Animated default gradient
-        self.bg_timer = QtCore.QTimer()
-        self.bg_timer.timeout.connect(self.update_default_background)
-        self.bg_timer.start(50)
+        else:
+            # Blurring a smooth gradient is a no-op but still renders offscreen
+            self.blur_effect.setEnabled(False)
+            self.update_default_background()
 
     # -------------------- Search --------------------
 
     def filter_sidebar(self):
+        # Items are built once in refresh_sidebar; filtering only toggles visibility
         query = self.search_bar.text().lower()
-        self.sidebar.clear()
-        for g in self.games:
-            if query in g.name.lower():
-                item = QtWidgets.QListWidgetItem()
-                item.setText(g.name)
-                item.setData(QtCore.Qt.UserRole, g.path)
-                icon = QtGui.QIcon(g.icon_path) if g.icon_path and os.path.exists(g.icon_path) else self.style().standardIcon(QtWidgets.QStyle.SP_ComputerIcon)
-                item.setIcon(icon)
-                self.sidebar.addItem(item)    
+        for key, item in self._sidebar_items.items():
+            game = self._by_path.get(key)
+            item.setHidden(game is None or query not in game._name_lower)
 
     # -------------------- Methods --------------------
-    def apply_shadow(self, widget, color=QtGui.QColor(125,0,230), blur=25, x=0, y=0):
-        shadow = QtWidgets.QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(blur)
-        shadow.setColor(color)
-        shadow.setOffset(x, y)
-        widget.setGraphicsEffect(shadow)
+    def _icon_for(self, path):
+        """Return the QIcon for an existing icon path (None for the fallback), decoding each file only once."""
+        icon = self._icon_cache.get(path)
+        if icon is None:
+            icon = QtGui.QIcon(path) if path else self._fallback_icon
+            self._icon_cache[path] = icon
+        return icon
+
+    def _icon_for_game(self, game):
+        return self._icon_for(game.icon_path if game and game._icon_ok else None)
 
     # -------------------- BG Blur --------------------
 
     def set_background_blur(self, value):
         self.bg_blur_amount = value
         self.blur_effect.setBlurRadius(value)
-        self.save_games()  # persist in games.json
+        self.save_games()  # persist in the library file
 
     # -------------------- Favorites --------------------
 
@@ -500,12 +996,12 @@ class GameNestLauncher(QtWidgets.QMainWindow):
         if not item:
             return
         # Get the game object by path
-        game = next((g for g in self.games if g.path == item.data(QtCore.Qt.UserRole)), None)
+        game = self._by_path.get(path_key(item.data(QtCore.Qt.UserRole)))
         if not game:
             return
 
         # Toggle the favorite variable
-        game.is_favorite = not getattr(game, "is_favorite", False)
+        game.set_favorite(not game.is_favorite)
 
         # Update the button text
         self.favorite_btn.setText("♥ Remove from Favorites" if game.is_favorite else "♡ Add to Favorites")
@@ -519,18 +1015,33 @@ class GameNestLauncher(QtWidgets.QMainWindow):
     # -------------------- Background --------------------
     def update_default_background(self):
         if self.custom_background_path: return
-        pix = QtGui.QPixmap(self.size())
-        pix.fill(QtCore.Qt.transparent)
-        painter = QtGui.QPainter(pix)
-        gradient = QtGui.QLinearGradient(0, 0, self.width(), self.height())
-        self.gradient_shift = (self.gradient_shift + 1) % 360
-        color1 = QtGui.QColor.fromHsv(self.gradient_shift, 255, 50)
-        color2 = QtGui.QColor.fromHsv((self.gradient_shift+60)%360, 255, 50)
-        gradient.setColorAt(0, color1)
-        gradient.setColorAt(1, color2)
-        painter.fillRect(self.rect(), gradient)
-        painter.end()
-        self.bg_label.setPixmap(pix)
+        # Let the style engine draw the gradient instead of painting a window-sized pixmap per tick
+        self.gradient_shift = (self.gradient_shift + 2) % 360
+        self.bg_label.setStyleSheet(
+            "background: qlineargradient(x1:0, y1:0, x2:1, y2:1, "
+            f"stop:0 hsv({self.gradient_shift},255,50), "
+            f"stop:1 hsv({(self.gradient_shift+60)%360},255,50));"
+        )
+
+    def _update_bg_timer(self):
+        # The gradient only needs to tick while it is actually on screen
+        if self.custom_background_path or self.isMinimized() or not self.isVisible():
+            self.bg_timer.stop()
+        elif not self.bg_timer.isActive():
+            self.bg_timer.start()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._update_bg_timer()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._update_bg_timer()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QtCore.QEvent.WindowStateChange:
+            self._update_bg_timer()
 
     def set_custom_background(self):
         dlg = QtWidgets.QFileDialog(self, "Select Background Image or GIF")
@@ -543,27 +1054,53 @@ class GameNestLauncher(QtWidgets.QMainWindow):
             self.load_background(path)
 
     def load_background(self, path):
+        self._update_bg_timer()
+        self.bg_label.setStyleSheet("")
+        self.blur_effect.setEnabled(True)
+        self._bg_scaled_key = None
         if path.lower().endswith(".gif"):
-            movie = QtGui.QMovie(path)
-            self.bg_label.setMovie(movie)
-            movie.start()
+            self._bg_raw = None
+            self._bg_movie = QtGui.QMovie(path)
+            self._bg_movie.setScaledSize(self.size())
+            self.bg_label.setMovie(self._bg_movie)
+            self._bg_movie.start()
         else:
-            pix = QtGui.QPixmap(path).scaled(self.size(), QtCore.Qt.KeepAspectRatioByExpanding, QtCore.Qt.SmoothTransformation)
-            self.bg_label.setPixmap(pix)
+            self._bg_movie = None
+            self._bg_raw = QtGui.QPixmap(path)
+            self._rescale_background()
+
+    def _rescale_background(self, mode=QtCore.Qt.SmoothTransformation):
+        if self._bg_movie is not None:
+            self._bg_movie.setScaledSize(self.size())
+            return
+        if self._bg_raw is None:
+            return
+        key = (self.width(), self.height(), mode)
+        if key == self._bg_scaled_key:
+            return
+        self._bg_scaled_key = key
+        self.bg_label.setPixmap(self._bg_raw.scaled(self.size(), QtCore.Qt.KeepAspectRatioByExpanding, mode))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.bg_label.setGeometry(0, 0, self.width(), self.height())
+        if self._bg_raw is not None or self._bg_movie is not None:
+            # Cheap scale while a resize drag is in progress, smooth once it settles
+            self._rescale_background(QtCore.Qt.FastTransformation)
+            self._bg_resize_timer.start()
 
     # -------------------- Sidebar / Game Selection --------------------
     def on_game_selected(self, item):
         path = item.data(QtCore.Qt.UserRole)
-        game = next((g for g in self.games if g.path == path), None)
+        game = self._by_path.get(path_key(path))
         if not game: return
         self.game_name.setText(game.name)
         self.game_path.setText(game.path)
-        icon = QtGui.QIcon(game.icon_path) if game.icon_path and os.path.exists(game.icon_path) else item.icon()
-        self.game_icon.setPixmap(icon.pixmap(128,128))
-        self.game_notes.setText(f"Notes: {getattr(game,'notes','')}")
-        self.game_last_played.setText(f"Last Played: {getattr(game,'last_played','Never')}")
-        self.game_playtime.setText(f"Total Playtime: {game.total_playtime//3600}h {(game.total_playtime%3600)//60}m {game.total_playtime%60}s")
-        self.favorite_btn.setText("♥ Remove from Favorites" if getattr(game,'is_favorite',False) else "♡ Add to Favorites")
+        self.game_icon.setPixmap(self._icon_for_game(game).pixmap(128,128))
+        self.game_notes.setText(f"Notes: {game.notes}")
+        self.game_last_played.setText(f"Last Played: {game.last_played}")
+        self.game_playtime.setText(f"Total Playtime: {game._playtime_str}")
+        self.favorite_btn.setText("♥ Remove from Favorites" if game.is_favorite else "♡ Add to Favorites")
 
     def sidebar_context_menu(self, pos):
         item = self.sidebar.itemAt(pos)
@@ -575,7 +1112,7 @@ class GameNestLauncher(QtWidgets.QMainWindow):
         notes_action = menu.addAction("Edit Notes")
         action = menu.exec_(self.sidebar.mapToGlobal(pos))
         path = item.data(QtCore.Qt.UserRole)
-        game = next((g for g in self.games if g.path == path), None)
+        game = self._by_path.get(path_key(path))
         if not game: return
         if action == launch_action:
             self.sidebar.setCurrentItem(item)
@@ -593,78 +1130,239 @@ class GameNestLauncher(QtWidgets.QMainWindow):
         dlg.setFileMode(QtWidgets.QFileDialog.Directory)
         if dlg.exec_():
             folder = dlg.selectedFiles()[0]
-            if folder not in self.custom_scan_folders:
-                self.custom_scan_folders.append(folder)
+            if path_key(folder) not in self.custom_scan_folders:
+                self.custom_scan_folders[path_key(folder)] = folder
+                self.save_games()
                 self.refresh_folders_list()
 
     def remove_scan_folder(self):
         items = self.folders_list.selectedItems()
         for item in items:
-            folder = item.text()
-            if folder in self.custom_scan_folders:
-                self.custom_scan_folders.remove(folder)
+            self.custom_scan_folders.pop(path_key(item.text()), None)
+        if items:
+            self.save_games()
         self.refresh_folders_list()
 
     def refresh_folders_list(self):
-        self.folders_list.clear()
-        for f in self.custom_scan_folders:
-            self.folders_list.addItem(f)
+        # Only add/remove the rows that changed, with one repaint at the end
+        self.folders_list.setUpdatesEnabled(False)
+        self.folders_list.blockSignals(True)
+        try:
+            shown = set()
+            for row in reversed(range(self.folders_list.count())):
+                key = path_key(self.folders_list.item(row).text())
+                if key in self.custom_scan_folders:
+                    shown.add(key)
+                else:
+                    self.folders_list.takeItem(row)
+            for key, folder in self.custom_scan_folders.items():
+                if key not in shown:
+                    self.folders_list.addItem(folder)
+        finally:
+            self.folders_list.blockSignals(False)
+            self.folders_list.setUpdatesEnabled(True)
 
     # -------------------- Reset --------------------
     def reset_games_list(self):
         confirm = QtWidgets.QMessageBox.question(self, "Confirm Reset", "Are you sure you want to clear all games?")
         if confirm == QtWidgets.QMessageBox.Yes:
             self.games = []
+            self._by_path = {}
             self.save_games()
             self.refresh_sidebar()
 
     # -------------------- Persistence --------------------
+    def _open_games_file(self, mode):
+        """Open the saved library for reading, preferring games.json.gz over plain games.json."""
+        if os.path.exists(self.games_gz_file):
+            return gzip.open(self.games_gz_file, mode, encoding="utf-8" if "t" in mode else None)
+        return open(self.games_file, mode, encoding="utf-8" if "t" in mode else None)
+
     def load_games(self):
-        if os.path.exists(self.games_file):
+        if os.path.exists(self.games_gz_file) or os.path.exists(self.games_file):
             try:
-                with open(self.games_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.games = []
+                self.games = []
+                self._by_path = {}
+                self._dropped_duplicates = False
+                if ijson is not None:
+                    data = self._stream_load_games()
+                else:
+                    with self._open_games_file("rb") as f:
+                        data = load_json(f.read())
                     for x in data.get("games", []):
-                        g = GameEntry.from_dict(x)
-                        g.notes = x.get("notes","")
-                        g.last_played = x.get("last_played","Never")
-                        self.games.append(g)
-                    self.custom_scan_folders = data.get("custom_scan_folders", [])
-                    self.custom_background_path = data.get("custom_background_path", None)
-                    self.bg_blur_amount = data.get("custom_background_blur", 0)
-                    self.blur_effect.setBlurRadius(self.bg_blur_amount)
-                    self.blur_slider.setValue(self.bg_blur_amount)
+                        self._add_loaded_game(x)
+                self.custom_scan_folders = {path_key(f): f for f in data.get("custom_scan_folders", [])}
+                self.custom_background_path = data.get("custom_background_path", None)
+                self.bg_blur_amount = data.get("custom_background_blur", 0)
+                self.blur_effect.setBlurRadius(self.bg_blur_amount)
+                self.blur_slider.setValue(self.bg_blur_amount)
+                if self._dropped_duplicates:
+                    # Rewrite the file without them, now that every setting is restored
+                    self.save_games()
             except Exception as e:
-                QtWidgets.QMessageBox.warning(self, "Error", f"Failed to load games.json: {e}")
+                QtWidgets.QMessageBox.warning(self, "Error", f"Failed to load the game library: {e}")
         else:
             self.save_games()
 
+    def _add_loaded_game(self, x):
+        key = path_key(x["path"])
+        if key in self._by_path:
+            # Older libraries could hold the same exe twice (or under another case); keep
+            # the first. No save from here: the stream may still be mid-parse
+            self._dropped_duplicates = True
+            return
+        g = GameEntry.from_dict(x)
+        self.games.append(g)
+        self._by_path[key] = g
+
+    def _stream_load_games(self):
+        """Parse games.json incrementally with ijson, adding games as they arrive.
+        Returns the top-level settings (everything except "games")."""
+        data = {"custom_scan_folders": []}
+        builder = None
+        with self._open_games_file("rb") as f:
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if builder is not None:
+                    builder.event(event, value)
+                    if prefix == "games.item" and event == "end_map":
+                        self._add_loaded_game(builder.value)
+                        builder = None
+                        # Keep the event loop alive on very large libraries
+                        if len(self.games) % 64 == 0:
+                            QtWidgets.QApplication.processEvents()
+                elif prefix == "games.item" and event == "start_map":
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                elif prefix == "custom_scan_folders.item":
+                    data["custom_scan_folders"].append(value)
+                elif prefix in ("custom_background_path", "custom_background_blur"):
+                    data[prefix] = value
+        return data
+
     def save_games(self):
+        # (Re)start the timer so bursts of changes (slider drags etc.) write once
+        self._save_pending = True
+        self._save_timer.start()
+
+    def _save_games_now(self):
+        self._save_timer.stop()
+        if not self._save_pending:
+            return  # nothing changed since the last write (e.g. quitting after a flush)
+        self._save_pending = False
+        payload = {
+            "games":[g.to_dict() for g in self.games],
+            "custom_scan_folders": list(self.custom_scan_folders.values()),
+            "custom_background_path": self.custom_background_path,
+            "custom_background_blur": getattr(self, "bg_blur_amount", 0)
+        }
+        # Write compact, lightly compressed JSON to a temp file and swap it in,
+        # so a crash mid-write can't corrupt the saved library
+        tmp = self.games_gz_file + ".tmp"
         try:
-            with open(self.games_file, "w", encoding="utf-8") as f:
-                json.dump({
-                    "games":[{**g.to_dict(), "notes":getattr(g,"notes",""), "last_played":getattr(g,"last_played","Never")} for g in self.games],
-                    "custom_scan_folders": self.custom_scan_folders,
-                    "custom_background_path": self.custom_background_path,
-                    "custom_background_blur": getattr(self, "bg_blur_amount", 0)
-                }, f, indent=2)
+            raw = dump_json(payload)
+            with gzip.open(tmp, "wb", compresslevel=3) as f:
+                f.write(raw)
+            os.replace(tmp, self.games_gz_file)
         except Exception as e:
-            QtWidgets.QMessageBox.warning(self, "Error", f"Failed to save games.json: {e}")
+            QtWidgets.QMessageBox.warning(self, "Error", f"Failed to save games.json.gz: {e}")
+            return
+        # The plain games.json from before the switch has been migrated; it would only go stale
+        if os.path.exists(self.games_file):
+            try:
+                os.remove(self.games_file)
+            except OSError as e:
+                print(f"Failed to remove old {self.games_file}: {e}")
 
     # -------------------- Sidebar Refresh --------------------
 
     def refresh_sidebar(self):
-        self.sidebar.clear()
-        for g in self.games:
-            item = QtWidgets.QListWidgetItem()
-            # Add heart if favorite
-            display_name = f"♥ {g.name}" if getattr(g, "is_favorite", False) else g.name
-            item.setText(display_name)
-            item.setData(QtCore.Qt.UserRole, g.path)
-            icon = QtGui.QIcon(g.icon_path) if g.icon_path and os.path.exists(g.icon_path) else self.style().standardIcon(QtWidgets.QStyle.SP_ComputerIcon)
-            item.setIcon(icon)
-            self.sidebar.addItem(item)
+        # Diff against the existing items: only added/removed games touch the list,
+        # everything else (renames, favorites) is updated in place
+        self.sidebar.setUpdatesEnabled(False)
+        self.sidebar.blockSignals(True)
+        try:
+            wanted = {path_key(g.path) for g in self.games}
+            for key in [k for k in self._sidebar_items if k not in wanted]:
+                item = self._sidebar_items.pop(key)
+                self.sidebar.takeItem(self.sidebar.row(item))
+                self._atlas_free.append(self._atlas_slots.pop(key))
+            for row, g in enumerate(self.games):
+                key = path_key(g.path)
+                # Add heart if favorite
+                display_name = f"♥ {g.name}" if g.is_favorite else g.name
+                item = self._sidebar_items.get(key)
+                if item is None:
+                    item = QtWidgets.QListWidgetItem(display_name)
+                    item.setData(QtCore.Qt.UserRole, g.path)
+                    item.setData(ATLAS_INDEX_ROLE, self._atlas_slot(g))
+                    self.sidebar.insertItem(row, item)
+                    self._sidebar_items[key] = item
+                    if g.icon_path is None:
+                        self._request_icon(g.path)
+                elif item.text() != display_name:
+                    item.setText(display_name)
+            # Keep the current search applied to the updated list
+            self.filter_sidebar()
+        finally:
+            self.sidebar.blockSignals(False)
+            self.sidebar.setUpdatesEnabled(True)
+
+    # Sidebar icons live in a few shared atlas pages, so the list uses a handful of textures.
+    # Each game keeps its slot while it stays in the library: only added games and finished
+    # icon extractions paint a row, and removed games just give their slot back.
+    def _atlas_slot(self, game):
+        key = path_key(game.path)
+        slot = self._atlas_slots.get(key)
+        if slot is None:
+            slot = self._atlas_free.pop() if self._atlas_free else len(self._atlas_slots)
+            self._atlas_slots[key] = slot
+            self._paint_atlas_row(slot, self._icon_for_game(game))
+        return slot
+
+    def _atlas_source(self, slot):
+        page, row = divmod(slot, ATLAS_PAGE_ROWS)
+        return self._atlas_pages[page], QtCore.QRect(0, ICON_SIZE * row, ICON_SIZE, ICON_SIZE)
+
+    def _paint_atlas_row(self, slot, icon):
+        page, row = divmod(slot, ATLAS_PAGE_ROWS)
+        while len(self._atlas_pages) <= page:
+            pixmap = QtGui.QPixmap(ICON_SIZE, ICON_SIZE * ATLAS_PAGE_ROWS)
+            pixmap.fill(QtCore.Qt.transparent)
+            self._atlas_pages.append(pixmap)
+        painter = QtGui.QPainter(self._atlas_pages[page])
+        rect = QtCore.QRect(0, ICON_SIZE * row, ICON_SIZE, ICON_SIZE)
+        painter.setCompositionMode(QtGui.QPainter.CompositionMode_Source)
+        painter.fillRect(rect, QtCore.Qt.transparent)
+        painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceOver)
+        icon.paint(painter, rect)
+        painter.end()
+
+    def _request_icon(self, exe_path):
+        # Extract off the GUI thread; the placeholder icon stays until the job reports back
+        if exe_path in self._icon_requested:
+            return
+        self._icon_requested.add(exe_path)
+        job = IconExtractJob(exe_path)
+        job.signals.done.connect(self._on_icon_extracted)
+        self._icon_jobs[exe_path] = job
+        QtCore.QThreadPool.globalInstance().start(job)
+
+    def _on_icon_extracted(self, exe_path, icon_path):
+        self._icon_jobs.pop(exe_path, None)
+        game = self._by_path.get(path_key(exe_path))
+        if not game or not icon_path:
+            return
+        game.set_icon_path(icon_path)
+        # The .bmp may have been rewritten in place; drop any stale decode
+        self._icon_cache.pop(icon_path, None)
+        icon = self._icon_for_game(game)
+        item = self._sidebar_items.get(path_key(exe_path))
+        if item is not None:
+            self._paint_atlas_row(item.data(ATLAS_INDEX_ROLE), icon)
+            self.sidebar.viewport().update(self.sidebar.visualItemRect(item))
+            if item is self.sidebar.currentItem():
+                self.game_icon.setPixmap(icon.pixmap(128,128))
+        self.save_games()
 
     # -------------------- Game Management --------------------
     def launch_selected_game(self):
@@ -673,22 +1371,86 @@ class GameNestLauncher(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.information(self, "Launch", "Please select a game first.")
             return
         path = item.data(QtCore.Qt.UserRole)
-        game = next((g for g in self.games if g.path == path), None)
+        game = self._by_path.get(path_key(path))
         if not game:
             return
+        if self._proc is not None:
+            QtWidgets.QMessageBox.information(self, "Launch", f"{self._proc_game.name} is already running.")
+            return
+
+        if not game.path.lower().endswith(".exe"):
+            # Shortcuts, .url and .bat files need the shell; their process can't be tracked for playtime
+            try:
+                os.startfile(game.path)
+            except OSError as ex:
+                QtWidgets.QMessageBox.warning(self, "Error", f"Failed to launch: {ex}")
+                return
+            game.last_played = QtCore.QDateTime.currentDateTime().toString("yyyy-MM-dd hh:mm:ss")
+            self.save_games()
+            self.on_game_selected(item)
+            return
+
+        # Detached, so closing the launcher never takes the game down with it. Many games
+        # load assets relative to the working directory, so start them in their own folder.
+        ok, pid = QtCore.QProcess.startDetached(game.path, [], os.path.dirname(game.path))
+        if not ok:
+            QtWidgets.QMessageBox.warning(self, "Error", f"Failed to launch: {game.path}")
+            return
         try:
-            os.startfile(path)
-            # update last played
+            self._proc_handle = win32api.OpenProcess(win32con.SYNCHRONIZE, False, pid)
+        except win32api.error:
+            # Started, but it can't be watched (e.g. it exited already): no session to record
             game.last_played = QtCore.QDateTime.currentDateTime().toString("yyyy-MM-dd hh:mm:ss")
             self.save_games()
             self.on_game_selected(item)
-        except Exception as e:
-            QtWidgets.QMessageBox.warning(self, "Error", f"Failed to launch: {e}")
+            return
+
+        # Wait for the exit without blocking the event loop; playtime is recorded when it fires
+        self._proc = QtCore.QWinEventNotifier(int(self._proc_handle), self)
+        self._proc.activated.connect(self._on_game_finished)
+        self._proc_game = game
+        self._start_time = time.monotonic()
+        # Only grey out Launch so the rest of the UI (and the animated bg) keeps running
+        self.launch_btn.setEnabled(False)
+
+    def _end_game_session(self):
+        """Stop watching the running game and record its session; returns (game, seconds)."""
+        session_seconds = int(time.monotonic() - self._start_time)
+        game = self._proc_game
+        self._proc.setEnabled(False)
+        self._proc.deleteLater()
+        self._proc_handle.Close()
+        self._proc = None
+        self._proc_handle = None
+        self._proc_game = None
+        self.launch_btn.setEnabled(True)
+
+        # Update playtime
+        game.add_playtime(session_seconds, QtCore.QDateTime.currentDateTime().toString("yyyy-MM-dd hh:mm:ss"))
+        self.save_games()
+        return game, session_seconds
+
+    def _on_game_finished(self, *_):
+        game, session_seconds = self._end_game_session()
+
+        item = self.sidebar.currentItem()
+        if item and item.data(QtCore.Qt.UserRole) == game.path:
+            self.on_game_selected(item)
+
+        # Show a small notification
+        QtWidgets.QMessageBox.information(self, "Playtime Recorded",
+                                          f"You played {game.name} for {format_playtime(session_seconds)} this session.")
+
+    def closeEvent(self, event):
+        if self._proc is not None:
+            # The game was started detached and keeps running; record the session up to now
+            self._end_game_session()
+        super().closeEvent(event)
 
     def rename_game(self, game):
         new_name, ok = QtWidgets.QInputDialog.getText(self, "Rename Game", "New name:", text=game.name)
         if ok and new_name:
-            game.name = new_name
+            game.rename(new_name)
             self.save_games()
             self.refresh_sidebar()
 
@@ -696,91 +1458,17 @@ class GameNestLauncher(QtWidgets.QMainWindow):
         confirm = QtWidgets.QMessageBox.question(self, "Confirm Removal", f"Remove {game.name}?")
         if confirm == QtWidgets.QMessageBox.Yes:
             self.games.remove(game)
+            self._by_path.pop(path_key(game.path), None)
             self.save_games()
             self.refresh_sidebar()
 
     def edit_notes(self, game):
-        text, ok = QtWidgets.QInputDialog.getMultiLineText(self, "Edit Notes", "Notes:", text=getattr(game,"notes",""))
+        text, ok = QtWidgets.QInputDialog.getMultiLineText(self, "Edit Notes", "Notes:", text=game.notes)
         if ok:
-            game.notes = text
+            game.set_notes(text)
             self.save_games()
             self.on_game_selected(self.sidebar.currentItem())
 
-    # -------------------- Sidebar Refresh --------------------
-
-    
-    def add_scan_folder(self):
-        dlg = QtWidgets.QFileDialog(self, "Select Folder to Scan")
-        dlg.setFileMode(QtWidgets.QFileDialog.Directory)
-        if dlg.exec_():
-            folder = dlg.selectedFiles()[0]
-            if folder not in self.custom_scan_folders:
-                self.custom_scan_folders.append(folder)
-                self.refresh_folders_list()
-
-    def remove_scan_folder(self):
-        items = self.folders_list.selectedItems()
-        for item in items:
-            folder = item.text()
-            if folder in self.custom_scan_folders:
-                self.custom_scan_folders.remove(folder)
-        self.refresh_folders_list()
-
-    def refresh_folders_list(self):
-        self.folders_list.clear()
-        for folder in self.custom_scan_folders:
-            self.folders_list.addItem(folder)
-
-    def reset_games_list(self):
-        self.games = []
-        self.save_games()
-        self.refresh_sidebar()
-
-    # -------------------- Game Management --------------------
-    def on_add_clicked(self):
-        self.add_game_manually()
-
-    def add_game_manually(self):
-        dlg = QtWidgets.QFileDialog(self, "Select Game Executable")
-        dlg.setFileMode(QtWidgets.QFileDialog.ExistingFile)
-        if dlg.exec_():
-            path = dlg.selectedFiles()[0]
-            name = os.path.basename(path)
-            self.games.append(GameEntry(name=name, path=path))
-            self.save_games()
-            self.refresh_sidebar()
-
-    def launch_selected_game(self):
-        item = self.sidebar.currentItem()
-        if not item:
-            QtWidgets.QMessageBox.information(self, "Launch", "Please select a game first.")
-            return
-        path = item.data(QtCore.Qt.UserRole)
-        try:
-            os.startfile(path)
-        except Exception as e:
-            QtWidgets.QMessageBox.warning(self, "Error", f"Failed to launch: {e}")
-
-    def remove_selected_game(self):
-        item = self.sidebar.currentItem()
-        if not item:
-            QtWidgets.QMessageBox.information(self, "Remove", "Please select a game first.")
-            return
-        name = item.text()
-        path = item.data(QtCore.Qt.UserRole)
-        confirm = QtWidgets.QMessageBox.question(
-            self,
-            "Confirm Removal",
-            f"Are you sure you want to remove '{name}'?"
-        )
-        if confirm == QtWidgets.QMessageBox.Yes:
-            self.games = [g for g in self.games if g.path != path]
-            self.save_games()
-            self.refresh_sidebar()
-            self.game_name.setText("Select a game")
-            self.game_path.setText("")
-            self.game_icon.clear()
-
     def rename_selected_game(self):
         item = self.sidebar.currentItem()
         if not item:
@@ -789,9 +1477,9 @@ class GameNestLauncher(QtWidgets.QMainWindow):
         old_name = item.text()
         new_name, ok = QtWidgets.QInputDialog.getText(self, "Rename Game", "New name:", text=old_name)
         if ok and new_name:
-            for g in self.games:
-                if g.path == item.data(QtCore.Qt.UserRole):
-                    g.name = new_name
+            game = self._by_path.get(path_key(item.data(QtCore.Qt.UserRole)))
+            if game:
+                game.rename(new_name)
             self.save_games()
             self.refresh_sidebar()
 
@@ -804,7 +1492,9 @@ class GameNestLauncher(QtWidgets.QMainWindow):
             f"Are you sure you want to remove '{name}' from the launcher?"
         )
         if confirm == QtWidgets.QMessageBox.Yes:
-            self.games = [g for g in self.games if g.path != path]
+            key = path_key(path)
+            self.games = [g for g in self.games if path_key(g.path) != key]
+            self._by_path.pop(key, None)
             self.save_games()
             self.refresh_sidebar()
             self.game_name.setText("Select a game")
@@ -825,8 +1515,11 @@ class GameNestLauncher(QtWidgets.QMainWindow):
         manual_action = menu.addAction("Add game manually")
         action = menu.exec_(QtGui.QCursor.pos())
         if action == detect_action:
-            if not is_admin():
-                run_as_admin()
+            if not self._is_admin:
+                # The elevated instance starts detection itself, so the click isn't lost
+                self._save_games_now()
+                if not run_as_admin(["--detect-on-start"]):
+                    QtWidgets.QMessageBox.information(self, "Detect", "Administrator rights are needed to detect games.")
             else:
                 self.detect_games()
         elif action == manual_action:
@@ -840,43 +1533,43 @@ class GameNestLauncher(QtWidgets.QMainWindow):
             paths = dlg.selectedFiles()
             if paths:
                 exe = paths[0]
+                if path_key(exe) in self._by_path:
+                    QtWidgets.QMessageBox.information(self, "Add Game", "This game is already in your library.")
+                    return
                 name = os.path.splitext(os.path.basename(exe))[0]
-                icon_path = get_game_icon(exe)
-                self.games.append(GameEntry(name, exe, icon_path))
+                # The icon is extracted in the background once the sidebar shows the game
+                game = GameEntry(name, exe)
+                self.games.append(game)
+                self._by_path[path_key(exe)] = game
                 self.save_games()
                 self.refresh_sidebar()
 
-    # -------------------- Settings / Scan Folders --------------------
-    def add_scan_folder(self):
-        dlg = QtWidgets.QFileDialog(self, "Select Folder to Scan")
-        dlg.setFileMode(QtWidgets.QFileDialog.Directory)
-        if dlg.exec_():
-            folder = dlg.selectedFiles()[0]
-            if folder not in self.custom_scan_folders:
-                self.custom_scan_folders.append(folder)
-                self.refresh_folders_list()
-
-    def remove_scan_folder(self):
-        items = self.folders_list.selectedItems()
-        for item in items:
-            folder = item.text()
-            if folder in self.custom_scan_folders:
-                self.custom_scan_folders.remove(folder)
-        self.refresh_folders_list()
-
-    def refresh_folders_list(self):
-        self.folders_list.clear()
-        for f in self.custom_scan_folders:
-            self.folders_list.addItem(f)
-
-    def reset_games_list(self):
-        confirm = QtWidgets.QMessageBox.question(self, "Confirm Reset", "Are you sure you want to clear all games?")
-        if confirm == QtWidgets.QMessageBox.Yes:
-            self.games = []
-            self.save_games()
-            self.refresh_sidebar()
+    def _load_icon_db(self):
+        """Return the on-disk icon cache, reading _icon_cache.json on first use."""
+        if self._icon_db is None:
+            try:
+                with open(self.icon_db_file, "rb") as f:
+                    self._icon_db = load_json(f.read())
+            except (OSError, ValueError):
+                self._icon_db = {}
+        return self._icon_db
+
+    def _save_icon_db(self):
+        if not self._icon_db_dirty:
+            return
+        tmp = self.icon_db_file + ".tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(dump_json(self._icon_db))
+            os.replace(tmp, self.icon_db_file)
+            self._icon_db_dirty = False
+        except OSError as e:
+            print(f"Failed to save icon cache: {e}")
 
     def detect_games(self):
+        if self._detect_dialog is not None:
+            self._detect_dialog.raise_()
+            return  # a scan is already running; its dialog is open
         default_folders = [
             r"C:\Program Files (x86)\Steam\steamapps\common",
             r"C:\Program Files\Epic Games",
@@ -884,104 +1577,81 @@ class GameNestLauncher(QtWidgets.QMainWindow):
             r"C:\Program Files\GOG Galaxy\Games",
             r"C:\Games"
         ]
-        to_scan = [p for p in default_folders + self.custom_scan_folders if os.path.exists(p)]
-
-        def find_game_exe(folder_path):
-            candidates = []
-            for root, dirs, files in os.walk(folder_path):
-                for f in files:
-                    if f.lower().endswith(".exe"):
-                        candidates.append(os.path.join(root, f))
-            if not candidates:
-                return None
-            folder_basename = os.path.basename(folder_path).lower()
-            for c in candidates:
-                if folder_basename in os.path.splitext(os.path.basename(c))[0].lower():
-                    if not any(x in os.path.basename(c).lower() for x in ['unitycrashhandler','_data','_x64']):
-                        return c
-            for c in candidates:
-                if 'launcher' in os.path.basename(c).lower():
-                    if not any(x in os.path.basename(c).lower() for x in ['unitycrashhandler','_data','_x64']):
-                        return c
-            filtered = [c for c in candidates if not any(x in os.path.basename(c).lower() for x in ['unitycrashhandler','_data','_x64'])]
-            if filtered:
-                return filtered[0]
-            return candidates[0]
-
-        candidates = []
-        for root in to_scan:
-            for entry in os.scandir(root):
-                if entry.is_dir():
-                    exe_found = find_game_exe(entry.path)
-                    if exe_found and not any(g.path == exe_found for g in self.games):
-                        icon_path = get_game_icon(exe_found)
-                        candidates.append(GameEntry(entry.name, exe_found, icon_path))
-
-        if not candidates:
-            QtWidgets.QMessageBox.information(self, "Detect", "No games found in the specified folders.")
-            return
-
-        dlg = QtWidgets.QDialog(self)
-        dlg.setWindowTitle("Detected games")
-        dlg.resize(600, 400)
-        layout = QtWidgets.QVBoxLayout()
-        listw = QtWidgets.QListWidget()
-        listw.setSelectionMode(QtWidgets.QAbstractItemView.MultiSelection)
-        for c in candidates:
-            item = QtWidgets.QListWidgetItem(f"{c.name} — {c.path}")
-            listw.addItem(item)
-        layout.addWidget(QtWidgets.QLabel(f"Detected {len(candidates)} games. Choose which to add:"))
-        layout.addWidget(listw)
-        btns = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Ok | QtWidgets.QDialogButtonBox.Cancel)
-        btns.accepted.connect(dlg.accept)
-        btns.rejected.connect(dlg.reject)
-        layout.addWidget(btns)
-        dlg.setLayout(layout)
-        if dlg.exec_() == QtWidgets.QDialog.Accepted:
-            selected = [candidates[i.row()] for i in listw.selectedIndexes()]
-            for s in selected:
-                if not any(g.path == s.path for g in self.games):
+        # Missing folders are skipped by the worker, keeping the existence checks off the UI thread
+        to_scan = default_folders + list(self.custom_scan_folders.values())
+
+        # The worker gets snapshots so it never touches launcher state from its thread
+        job = self._detect_job = DetectGamesJob(to_scan, set(self._by_path), dict(self._load_icon_db()))
+        job.signals.progress.connect(self._on_detect_progress)
+        job.signals.found.connect(self._on_detect_found)
+        job.signals.finished.connect(self._on_detect_finished)
+
+        # The dialog opens right away and fills in as results stream from the worker
+        dlg = self._detect_dialog = DetectDialog(self._icon_for_game, self)
+        QtCore.QThreadPool.globalInstance().start(job)
+        accepted = dlg.exec_() == QtWidgets.QDialog.Accepted
+        self._detect_dialog = None
+        if self._detect_job is job:
+            # Cancelled mid-scan: stop the worker and detach it, so a new scan can start
+            # right away without the old one's results reaching it. Icons it already
+            # extracted still go into the cache.
+            job.cancel()
+            self._detect_job = None
+            job.signals.progress.disconnect()
+            job.signals.found.disconnect()
+            job.signals.finished.disconnect()
+            job.signals.finished.connect(self._merge_icon_db_updates)
+        if accepted:
+            for s in dlg.selected_entries():
+                if path_key(s.path) not in self._by_path:
                     self.games.append(s)
+                    self._by_path[path_key(s.path)] = s
             self.save_games()
             self.refresh_sidebar()
+        dlg.deleteLater()
 
-    # -------------------- Settings Tab --------------------
-    def add_scan_folder(self):
-        dlg = QtWidgets.QFileDialog(self, "Select Folder to Scan")
-        dlg.setFileMode(QtWidgets.QFileDialog.Directory)
-        if dlg.exec_():
-            folder = dlg.selectedFiles()[0]
-            if folder not in self.custom_scan_folders:
-                self.custom_scan_folders.append(folder)
-                self.refresh_folders_list()
-
-    def remove_scan_folder(self):
-        items = self.folders_list.selectedItems()
-        for item in items:
-            folder = item.text()
-            if folder in self.custom_scan_folders:
-                self.custom_scan_folders.remove(folder)
-        self.refresh_folders_list()
+    def _on_detect_progress(self, done, folder_name):
+        if self._detect_dialog is not None:
+            self._detect_dialog.set_progress(done, folder_name)
 
-    def refresh_folders_list(self):
-        self.folders_list.clear()
-        for f in self.custom_scan_folders:
-            self.folders_list.addItem(f)
+    def _on_detect_found(self, batch):
+        if self._detect_dialog is None:
+            return
+        # Re-check against the library in case games were added while the scan ran
+        self._detect_dialog.model.append_entries([GameEntry(name, exe, icon_path) for name, exe, icon_path in batch
+                                                  if path_key(exe) not in self._by_path])
+
+    def _merge_icon_db_updates(self, icon_db_updates):
+        if icon_db_updates:
+            self._icon_db.update(icon_db_updates)
+            self._icon_db_dirty = True
+            self._save_icon_db()
+
+    def _on_detect_finished(self, icon_db_updates):
+        self._detect_job = None
+        self._merge_icon_db_updates(icon_db_updates)
+
+        dlg = self._detect_dialog
+        if dlg is None:
+            return
+        if dlg.model.rowCount() == 0:
+            dlg.reject()
+            QtWidgets.QMessageBox.information(self, "Detect", "No games found in the specified folders.")
+            return
+        dlg.scan_finished()
 
-    def reset_games_list(self):
-        confirm = QtWidgets.QMessageBox.question(self, "Confirm Reset", "Are you sure you want to clear all games?")
-        if confirm == QtWidgets.QMessageBox.Yes:
-            self.games = []
-            self.save_games()
-            self.refresh_sidebar()
 
+# -------------------- Main --------------------
 def main():
     app = QtWidgets.QApplication(sys.argv)
     win = GameNestLauncher()
+    if "--detect-on-start" in sys.argv:
+        # Relaunched elevated from the Detect action: carry on where the user left off
+        QtCore.QTimer.singleShot(0, win.detect_games)
     win.show()
     sys.exit(app.exec_())
 
 
 if __name__ == "__main__":
-
+    # The launcher runs unelevated; Detect asks for admin rights when it needs them
     main()